@@ -0,0 +1,6 @@
+import os
+import sys
+
+# The service modules live at the repository root and import each other
+# by top-level name (``tts_main``, ``tts_providers``).
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
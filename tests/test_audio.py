@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+import tts_main
+
+
+def _convert(func, x):
+    out = np.empty(x.size, dtype=np.int16)
+    func(x, out)
+    return out
+
+
+@pytest.mark.parametrize("amplitude", [1e-3, 0.5, 1.0, 3.7])
+def test_numba_and_numpy_quantisation_match(amplitude):
+    if not tts_main.NUMBA_AVAILABLE:
+        pytest.skip("numba is not installed")
+    rng = np.random.default_rng(0)
+    x = (rng.standard_normal(10_001) * amplitude).astype(np.float32)
+    np.testing.assert_array_equal(
+        _convert(tts_main._f32_to_pcm16, x),
+        _convert(tts_main._f32_to_pcm16_numpy, x),
+    )
+
+
+def test_in_range_audio_is_scaled_like_astype():
+    rng = np.random.default_rng(1)
+    x = rng.uniform(-1.0, 1.0, 10_001).astype(np.float32)
+    expected = (x * 32767.0).astype(np.int16)
+    np.testing.assert_array_equal(_convert(tts_main._f32_to_pcm16, x), expected)
+    np.testing.assert_array_equal(_convert(tts_main._f32_to_pcm16_numpy, x), expected)
@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from tts_batching import DynamicBatcher
+
+
+class FakeBatchProvider:
+    def __init__(self):
+        self.calls = []
+        self.fail_next = False
+        self.drop_result = False
+
+    def synthesize_batch(self, texts, voice_preset=None):
+        self.calls.append((list(texts), voice_preset))
+        if self.fail_next:
+            self.fail_next = False
+            raise RuntimeError("model exploded")
+        results = [(f"{voice_preset}:{text}", 24000) for text in texts]
+        if self.drop_result:
+            results = results[:-1]
+        return results
+
+
+def run(coro):
+    return asyncio.run(asyncio.wait_for(coro, timeout=5))
+
+
+def test_requests_are_grouped_by_kwargs():
+    provider = FakeBatchProvider()
+
+    async def scenario():
+        batcher = DynamicBatcher(provider, max_batch_size=8, max_wait_ms=50)
+        return await asyncio.gather(
+            batcher.submit("a", voice_preset="x"),
+            batcher.submit("b", voice_preset="y"),
+            batcher.submit("c", voice_preset="x"),
+        )
+
+    results = run(scenario())
+    assert results == [("x:a", 24000), ("y:b", 24000), ("x:c", 24000)]
+    assert sorted(provider.calls) == [(["a", "c"], "x"), (["b"], "y")]
+
+
+def test_unhashable_kwarg_fails_only_its_request():
+    provider = FakeBatchProvider()
+
+    async def scenario():
+        batcher = DynamicBatcher(provider, max_wait_ms=50)
+        return await asyncio.gather(
+            batcher.submit("a", voice_preset=["x"]),
+            batcher.submit("b", voice_preset="y"),
+            return_exceptions=True,
+        )
+
+    bad, good = run(scenario())
+    assert isinstance(bad, TypeError)
+    assert good == ("y:b", 24000)
+
+
+def test_failing_batch_keeps_consumer_alive():
+    provider = FakeBatchProvider()
+    provider.fail_next = True
+
+    async def scenario():
+        batcher = DynamicBatcher(provider, max_wait_ms=1)
+        with pytest.raises(RuntimeError, match="model exploded"):
+            await batcher.submit("a")
+        task = batcher._task
+        result = await batcher.submit("b")
+        assert batcher._task is task and not task.done()
+        return result
+
+    assert run(scenario()) == ("None:b", 24000)
+
+
+def test_short_result_list_fails_every_request():
+    provider = FakeBatchProvider()
+    provider.drop_result = True
+
+    async def scenario():
+        batcher = DynamicBatcher(provider, max_wait_ms=50)
+        results = await asyncio.gather(
+            batcher.submit("a"),
+            batcher.submit("b"),
+            return_exceptions=True,
+        )
+        provider.drop_result = False
+        return results, await batcher.submit("c")
+
+    results, later = run(scenario())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert later == ("None:c", 24000)
@@ -0,0 +1,43 @@
+import base64
+import random
+
+import pytest
+
+pytest.importorskip("elevenlabs")
+
+from tts_providers.elevenlabs_provider import ElevenLabsProvider
+
+
+def _encode(chunks):
+    provider = ElevenLabsProvider(api_key="test", sample_rate=16000)
+    provider._stream = lambda text, voice_id, model_id: iter(chunks)
+    return provider.synthesize_b64("hello")
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        [],
+        [b""],
+        [b"a"],
+        [b"ab"],
+        [b"abc"],
+        [b"abcd"],
+        [b"a", b"", b"b", b"c"],
+        [b"a", b"bcdefgh"],
+        [b"ab", b"c", b"d", b"efghij"],
+        [b"abcd", b"e", b"", b"fg", b"hijklmn"],
+    ],
+)
+def test_synthesize_b64_matches_joined_encoding(chunks):
+    encoded, sample_rate = _encode(chunks)
+    assert encoded == base64.b64encode(b"".join(chunks)).decode("ascii")
+    assert sample_rate == 16000
+
+
+def test_synthesize_b64_random_chunking():
+    rng = random.Random(0)
+    for _ in range(500):
+        chunks = [rng.randbytes(rng.randint(0, 9)) for _ in range(rng.randint(0, 8))]
+        encoded, _ = _encode(chunks)
+        assert encoded == base64.b64encode(b"".join(chunks)).decode("ascii")
@@ -0,0 +1,74 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
+
+import httpx
+import numpy as np
+import pytest
+
+import tts_main
+
+
+class NotThreadSafeProvider:
+    """Fake provider that records how many calls run at the same time."""
+
+    def __init__(self):
+        self._guard = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def synthesize(self, text, **kwargs):
+        with self._guard:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.05)
+        with self._guard:
+            self.active -= 1
+        return np.zeros(160, dtype=np.float32), 16000
+
+
+@pytest.mark.parametrize("name", ["coqui", "kokoro"])
+def test_concurrent_requests_never_overlap_in_the_model(monkeypatch, name):
+    provider = NotThreadSafeProvider()
+    key_env = f"API_KEY_{name.upper()}"
+    monkeypatch.setenv(key_env, "secret")
+    tts_main._expected_key.cache_clear()
+    monkeypatch.setattr(tts_main, "get_provider", lambda requested: provider)
+    monkeypatch.setattr(tts_main, "_batchers", {})
+    # A wide pool, so overlapping calls are possible however many CPUs exist
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+    monkeypatch.setattr(tts_main, "_EXECUTOR", executor)
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=tts_main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await asyncio.gather(*(
+                client.post(
+                    f"/tts/{name}",
+                    json={"text": f"hello {i}"},
+                    headers={"Authorization": "Bearer secret"},
+                )
+                for i in range(6)
+            ))
+
+    try:
+        responses = asyncio.run(asyncio.wait_for(scenario(), timeout=10))
+    finally:
+        executor.shutdown(wait=True)
+    tts_main._expected_key.cache_clear()
+    assert [r.status_code for r in responses] == [200] * 6
+    assert provider.max_active == 1
+
+
+def test_cached_provider_is_resolved_without_the_pool(monkeypatch):
+    import tts_providers
+
+    provider = object()
+    monkeypatch.setitem(tts_providers._providers, "coqui", provider)
+
+    async def no_pool(*args, **kwargs):
+        raise AssertionError("cached provider went through the thread pool")
+
+    monkeypatch.setattr(tts_main, "run_blocking", no_pool)
+    assert asyncio.run(tts_main.resolve_provider("Coqui")) is provider
@@ -0,0 +1,51 @@
+import logging
+import threading
+import time
+
+from fastapi.testclient import TestClient
+
+import tts_main
+import tts_providers
+
+
+def test_startup_warms_providers_in_background(monkeypatch):
+    warmed = []
+    done = threading.Event()
+
+    def fake_warm_provider(name):
+        warmed.append(name)
+        if len(warmed) == 2:
+            done.set()
+        if name == "coqui":
+            raise ValueError("Coqui provider is not available")
+
+    monkeypatch.setattr(tts_main, "WARM_PROVIDERS", ["bark", "coqui"])
+    monkeypatch.setattr(tts_main, "warm_provider", fake_warm_provider)
+
+    with TestClient(tts_main.app) as client:
+        response = client.get("/health")
+        assert response.status_code == 200
+        assert response.json() == {"status": "healthy", "service": "ZapperTTSService"}
+        assert done.wait(timeout=5)
+
+    assert sorted(warmed) == ["bark", "coqui"]
+    assert tts_main._warm_task is None
+
+
+def test_startup_skips_unavailable_default_providers(monkeypatch, caplog):
+    # Mark every provider unavailable so the test exercises the skip path
+    # without loading real models, whatever is installed.
+    for flag in ("BARK_AVAILABLE", "COQUI_AVAILABLE", "ELEVENLABS_AVAILABLE", "KOKORO_AVAILABLE"):
+        monkeypatch.setattr(tts_providers, flag, False)
+    monkeypatch.setattr(tts_providers, "_providers", {})
+    caplog.set_level(logging.INFO, logger="tts_main")
+
+    with TestClient(tts_main.app) as client:
+        assert client.get("/health").status_code == 200
+        deadline = time.monotonic() + 5
+        while not tts_main._warm_task.done() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert tts_main._warm_task.done()
+
+    skipped = [r.getMessage() for r in caplog.records if r.getMessage().startswith("Skipping")]
+    assert len(skipped) == len(tts_main.WARM_PROVIDERS)
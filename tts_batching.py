@@ -0,0 +1,132 @@
+"""Dynamic request batching for the Zapper TTS service.
+
+Concurrent requests for the same provider are collected into a queue
+and a background task hands them to the provider's
+``synthesize_batch`` method in groups.  Requests are gathered until
+either ``max_batch_size`` items are waiting or ``max_wait_ms`` has
+elapsed since the first one arrived, so the model runs one batched
+forward pass instead of one pass per caller.  Only requests with
+identical keyword arguments (e.g. the same ``voice_preset``) are
+batched together.
+
+Providers without a ``synthesize_batch`` method are served one item at
+a time through their regular ``synthesize`` method.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class DynamicBatcher:
+    """Queue requests for a single provider and synthesize them in batches."""
+
+    def __init__(
+        self,
+        provider: Any,
+        max_batch_size: int = 8,
+        max_wait_ms: float = 20.0,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> None:
+        self.provider = provider
+        # None selects the event loop's default executor
+        self.executor = executor
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _ensure_started(self) -> None:
+        # The queue and consumer task must be created inside the running
+        # event loop, so they are set up on the first submission.  A queue
+        # that still holds requests is never replaced; if the consumer has
+        # stopped it is restarted on the same queue.
+        loop = asyncio.get_running_loop()
+        if self._queue is None or (self._loop is not loop and self._queue.empty()):
+            self._queue = asyncio.Queue()
+            self._loop = loop
+            self._task = None
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+
+    async def submit(self, text: str, **kwargs: Any) -> Tuple[Any, int]:
+        """Queue ``text`` for synthesis and wait for its ``(audio, sample_rate)``."""
+        self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, kwargs, future))
+        return await future
+
+    async def _collect(self) -> List[Tuple[str, Dict[str, Any], asyncio.Future]]:
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect()
+            try:
+                await self._process(batch)
+            except Exception as exc:
+                # Never let one bad batch stop the consumer: fail its
+                # requests and carry on with the next one
+                logger.exception("Batch processing failed: %s", exc)
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+
+    async def _process(self, batch: List[Tuple[str, Dict[str, Any], asyncio.Future]]) -> None:
+        groups: Dict[Tuple[Tuple[str, Any], ...], List[Tuple[str, asyncio.Future]]] = {}
+        for text, kwargs, future in batch:
+            key = tuple(sorted(kwargs.items()))
+            try:
+                hash(key)
+            except TypeError:
+                future.set_exception(TypeError(f"Batch arguments must be hashable, got {kwargs!r}"))
+                continue
+            groups.setdefault(key, []).append((text, future))
+        for key, items in groups.items():
+            await self._dispatch(dict(key), items)
+
+    def _synthesize(self, texts: List[str], kwargs: Dict[str, Any]) -> List[Tuple[Any, int]]:
+        synthesize_batch = getattr(self.provider, "synthesize_batch", None)
+        if synthesize_batch is not None:
+            return synthesize_batch(texts, **kwargs)
+        return [self.provider.synthesize(text, **kwargs) for text in texts]
+
+    async def _dispatch(self, kwargs: Dict[str, Any], items: List[Tuple[str, asyncio.Future]]) -> None:
+        # Drop requests whose callers have already gone away
+        items = [(text, future) for text, future in items if not future.done()]
+        if not items:
+            return
+        texts = [text for text, _ in items]
+        logger.debug("Dispatching batch of %d request(s)", len(texts))
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(self.executor, self._synthesize, texts, kwargs)
+            if len(results) != len(items):
+                raise RuntimeError(
+                    f"synthesize_batch returned {len(results)} result(s) for {len(items)} text(s)"
+                )
+        except Exception as exc:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), result in zip(items, results):
+            if not future.done():
+                future.set_result(result)
@@ -10,19 +10,38 @@ managed in a similar way.
 
 from __future__ import annotations
 
-import base64
-import io
+import asyncio
+import concurrent.futures
+import functools
+import hmac
 import os
+import struct
 import time
-import wave
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
+import orjson
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import logging
 
-from tts_providers import get_provider
+from tts_batching import DynamicBatcher
+from tts_providers import get_cached_provider, get_provider, warm_provider
+
+# pybase64 provides SIMD accelerated base64 encoding; fall back to the
+# standard library when it is not installed.
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+# Numba fuses the peak scan and the int16 quantisation into a single pass
+# over the samples.  The NumPy path below is used when it is unavailable.
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 
 logging.basicConfig(
@@ -31,24 +50,190 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
+
+# Synthesis and audio encoding are blocking, CPU bound calls.  They run
+# on this pool so the event loop stays free to serve other requests.
+_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="tts")
+
+
+async def run_blocking(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run ``func(*args, **kwargs)`` on the synthesis thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_EXECUTOR, functools.partial(func, *args, **kwargs))
+
+
+async def resolve_provider(name: str) -> Any:
+    """Return the named provider, loading it on the thread pool if needed.
+
+    Already loaded providers are returned directly, so steady-state
+    requests don't queue behind running synthesis for a pool worker.
+    """
+    provider = get_cached_provider(name)
+    if provider is None:
+        provider = await run_blocking(get_provider, name)
+    return provider
+
+
+# Concurrent requests to providers that support batched inference are
+# grouped into a single model call.  See ``tts_batching`` for details.
+BATCH_MAX_SIZE = int(os.getenv("TTS_BATCH_MAX_SIZE", "8"))
+BATCH_MAX_WAIT_MS = float(os.getenv("TTS_BATCH_MAX_WAIT_MS", "20"))
+_batchers: Dict[str, DynamicBatcher] = {}
+
+
+def get_batcher(name: str, provider: Any, max_batch_size: Optional[int] = None) -> DynamicBatcher:
+    """Return the request batcher for ``provider``, creating it on first use.
+
+    A batcher runs one model call at a time, so it also serialises access
+    to providers whose models are not thread-safe.  Pass
+    ``max_batch_size=1`` for providers that cannot batch; their requests
+    are then dispatched as soon as they arrive.
+    """
+    batcher = _batchers.get(name)
+    if batcher is None or batcher.provider is not provider:
+        single = max_batch_size == 1
+        batcher = DynamicBatcher(
+            provider,
+            max_batch_size=BATCH_MAX_SIZE if max_batch_size is None else max_batch_size,
+            max_wait_ms=0.0 if single else BATCH_MAX_WAIT_MS,
+            executor=_EXECUTOR,
+        )
+        _batchers[name] = batcher
+    return batcher
+
+
+def _f32_to_pcm16_numpy(x, out):
+    # Peak from max/min avoids materialising np.abs(x), and the scaled
+    # samples are cast straight into ``out`` without a float temporary.
+    # The scale is computed and applied in float32, like the Numba kernel,
+    # so both paths produce identical samples.
+    peak = max(float(x.max(initial=0.0)), -float(x.min(initial=0.0)), 1.0)
+    scale = np.float32(32767.0) / np.float32(peak)
+    np.multiply(x, scale, out=out, casting='unsafe')
+
+
+if NUMBA_AVAILABLE:
+    # Serial on purpose: requests are already spread across the _EXECUTOR
+    # threads, and Numba's workqueue threading layer aborts the process
+    # when parallel kernels are entered from several threads at once.
+    # Only fast-math flags that cannot change the float32 results are used.
+    @njit(fastmath={'nnan', 'ninf', 'nsz'}, cache=True, nogil=True)
+    def _f32_to_pcm16(x, out):
+        m = np.float32(0.0)
+        for i in range(x.size):
+            m = max(m, abs(x[i]))
+        s = np.float32(32767.0) / np.float32(max(m, np.float32(1.0)))
+        for i in range(x.size):
+            out[i] = np.int16(np.float32(x[i]) * s)
+
+    # Pay the JIT compilation cost at import time rather than on the
+    # first request.
+    _f32_to_pcm16(np.zeros(16, dtype=np.float32), np.empty(16, dtype=np.int16))
+else:
+    _f32_to_pcm16 = _f32_to_pcm16_numpy
+
+
+def _to_pcm16(audio: np.ndarray) -> np.ndarray:
+    """Normalise ``audio`` to [-1, 1] if needed and quantise to int16."""
+    audio_arr = np.ascontiguousarray(audio, dtype=np.float32).ravel()
+    out = np.empty(audio_arr.size, dtype=np.int16)
+    _f32_to_pcm16(audio_arr, out)
+    return out
+
+
+def _wav_header(n_samples: int, sample_rate: int) -> bytes:
+    """Return the 44 byte RIFF/WAVE header for mono 16-bit PCM audio."""
+    data_size = 2 * n_samples
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_size, b'WAVE',
+        b'fmt ', 16, 1, 1, sample_rate, 2 * sample_rate, 2, 16,
+        b'data', data_size,
+    )
+
+
+class _LazyHeaders:
+    """Render request headers only if the log record is actually emitted."""
+
+    __slots__ = ("headers",)
+
+    def __init__(self, headers: Any) -> None:
+        self.headers = headers
+
+    def __str__(self) -> str:
+        return str(dict(self.headers))
 
 
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
+    if not logger.isEnabledFor(logging.INFO):
+        return await call_next(request)
     start_time = time.time()
-    logger.info("=== Incoming Request ===")
-    logger.info("Method: %s", request.method)
-    logger.info("URL: %s", request.url)
-    logger.info("Client: %s", request.client.host if request.client else 'Unknown')
-    logger.info("Headers: %s", dict(request.headers))
-    response = await call_next(request)
-    process_time = time.time() - start_time
-    logger.info("=== Response ===")
-    logger.info("Status: %s", response.status_code)
-    logger.info("Process Time: %.3fs", process_time)
-    logger.info("=====================")
-    return response
+    status: Any = "unhandled exception"
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # Written in ``finally`` so requests whose handler raised are logged too
+        logger.info(
+            "%s %s from %s -> %s in %.3fs (headers: %s)",
+            request.method,
+            request.url,
+            request.client.host if request.client else 'Unknown',
+            status,
+            time.time() - start_time,
+            _LazyHeaders(request.headers),
+        )
+
+
+# Providers whose models are loaded in the background at startup so the
+# first request to each endpoint does not pay the load cost.
+WARM_PROVIDERS = [
+    name.strip()
+    for name in os.getenv("TTS_WARM_PROVIDERS", "bark,coqui,kokoro,elevenlabs").split(",")
+    if name.strip()
+]
+_warm_task: Optional[asyncio.Task] = None
+
+
+async def _warm_one(name: str) -> None:
+    start = time.time()
+    logger.info("Warming %s provider …", name)
+    try:
+        await run_blocking(warm_provider, name)
+    except ValueError as exc:
+        logger.info("Skipping %s provider warm-up: %s", name, exc)
+    except Exception as exc:
+        logger.exception("Failed to warm %s provider: %s", name, exc)
+    else:
+        logger.info("%s provider ready in %.1fs", name, time.time() - start)
+
+
+async def _warm_all(names: List[str]) -> None:
+    await asyncio.gather(*(_warm_one(name) for name in names))
+
+
+@app.on_event("startup")
+async def warm_providers() -> None:
+    """Start loading the configured providers without delaying startup."""
+    global _warm_task
+    if WARM_PROVIDERS:
+        _warm_task = asyncio.get_running_loop().create_task(_warm_all(WARM_PROVIDERS))
+
+
+@app.on_event("shutdown")
+async def cancel_warm_up() -> None:
+    """Stop waiting on a warm-up that is still running at shutdown."""
+    global _warm_task
+    if _warm_task is not None and not _warm_task.done():
+        _warm_task.cancel()
+        try:
+            await _warm_task
+        except asyncio.CancelledError:
+            pass
+    _warm_task = None
 
 
 @app.get("/")
@@ -58,81 +243,130 @@ async def health_check():
     return {"status": "healthy", "service": "ZapperTTSService"}
 
 
+# Tokens that recently passed validation, keyed by (key_env, token) and
+# mapped to the monotonic time at which they must be checked again.
+_TOKEN_TTL_SECONDS = 60.0
+_accepted: Dict[Tuple[str, str], float] = {}
+
+
+@functools.lru_cache(maxsize=8)
+def _expected_key(key_env: str) -> Optional[str]:
+    """Return the configured API key for ``key_env`` (read once per process)."""
+    return os.getenv(key_env)
+
+
 def validate_key(request: Request, key_env: str) -> None:
     """Validate the Authorization header against an environment variable.
 
     This helper behaves similarly to the one in the SensitiveInfoDetector.  If
     the header is missing, malformed or does not match the configured key
-    the appropriate HTTPException is raised.
+    the appropriate HTTPException is raised.  Accepted tokens are
+    remembered for a short time so repeat callers skip the comparison.
     """
-    logger.info("Validating API key for environment variable: %s", key_env)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Validating API key for environment variable: %s", key_env)
     auth = request.headers.get("Authorization", "")
     if not auth.startswith("Bearer "):
         logger.warning("Missing or invalid Authorization header format")
         raise HTTPException(status_code=401, detail="Missing Authorization header")
     token = auth.split(" ", 1)[1]
-    expected = os.getenv(key_env)
+    cache_key = (key_env, token)
+    now = time.monotonic()
+    expiry = _accepted.get(cache_key)
+    if expiry is not None and expiry > now:
+        return
+    expected = _expected_key(key_env)
     if expected is None or expected == "":
         logger.error("Environment variable %s is not set!", key_env)
         raise HTTPException(status_code=500, detail=f"Server configuration error: {key_env} not configured")
-    if token != expected:
+    if not hmac.compare_digest(token.encode('utf-8'), expected.encode('utf-8')):
         logger.warning("Invalid API key provided for %s", key_env)
         raise HTTPException(status_code=403, detail="Invalid API key")
-    logger.info("API key validated successfully for %s", key_env)
+    _accepted[cache_key] = now + _TOKEN_TTL_SECONDS
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("API key validated successfully for %s", key_env)
+
+
+async def read_json_body(request: Request) -> Dict[str, Any]:
+    """Parse the request body as a JSON object using orjson.
 
+    Raises:
+        HTTPException: 400 if the body is not valid JSON or not an object.
+    """
+    try:
+        data = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Request body must be valid JSON")
+    if not isinstance(data, dict):
+        raise HTTPException(status_code=400, detail="Request body must be a JSON object")
+    return data
 
+
+@functools.singledispatch
 def audio_to_base64(audio: Any, sample_rate: int) -> str:
     """Convert either a numpy array or raw bytes into a base64 WAV string.
 
     If ``audio`` is already bytes, it is assumed to be a complete audio
     stream at the correct sample rate (e.g. from ElevenLabs) and is
-    simply encoded.  Otherwise the numpy array is normalised and
-    written into an in-memory WAV container.
+    simply encoded.  Otherwise the numpy array is written into an
+    in-memory WAV container: int16 arrays are used as-is and any other
+    dtype is normalised and quantised to 16-bit PCM first.  The
+    implementation is selected by the type of ``audio``.
 
     Args:
-        audio: numpy array of floats in [-1, 1] or raw PCM bytes
+        audio: numpy array of floats in [-1, 1], int16 PCM samples or raw
+            PCM bytes
         sample_rate: the sample rate of the audio
 
     Returns:
         A base64 encoded WAV file.
     """
-    # If it's already bytes we simply base64 encode directly
-    if isinstance(audio, (bytes, bytearray)):
-        logger.debug("Audio is raw bytes; encoding directly to base64")
-        return base64.b64encode(audio).decode('utf-8')
-    # Otherwise we assume a 1-D numpy array
-    if not isinstance(audio, np.ndarray):
-        raise ValueError("Audio must be either numpy.ndarray or bytes")
-    audio_arr = audio.astype(np.float32)
-    # Normalise to the range [-1, 1] if necessary
-    max_abs = np.max(np.abs(audio_arr)) if audio_arr.size else 0.0
-    if max_abs > 1.0:
-        audio_arr = audio_arr / max_abs
-    # Convert to 16-bit PCM
-    int16_audio = (audio_arr * 32767.0).astype(np.int16)
-    buffer = io.BytesIO()
-    with wave.open(buffer, 'wb') as wf:
-        wf.setnchannels(1)
-        wf.setsampwidth(2)  # 2 bytes per sample
-        wf.setframerate(sample_rate)
-        wf.writeframes(int16_audio.tobytes())
-    wav_bytes = buffer.getvalue()
-    return base64.b64encode(wav_bytes).decode('utf-8')
+    raise ValueError("Audio must be either numpy.ndarray or bytes")
+
+
+@audio_to_base64.register(bytes)
+@audio_to_base64.register(bytearray)
+def _bytes_to_base64(audio: bytes, sample_rate: int) -> str:
+    # Already encoded audio; we simply base64 encode it directly
+    logger.debug("Audio is raw bytes; encoding directly to base64")
+    return base64.b64encode(audio).decode('ascii')
+
+
+@audio_to_base64.register(np.ndarray)
+def _array_to_base64(audio: np.ndarray, sample_rate: int) -> str:
+    if audio.dtype == np.int16:
+        # Already 16-bit PCM; only make sure it is a flat little-endian buffer
+        int16_audio = np.ascontiguousarray(audio, dtype='<i2').ravel()
+    else:
+        # Normalise to the range [-1, 1] if necessary and convert to 16-bit PCM
+        int16_audio = _to_pcm16(audio)
+    # Copy the samples once, straight after the header, rather than via
+    # tobytes() and a concatenation
+    header = _wav_header(int16_audio.size, sample_rate)
+    wav = bytearray(len(header) + int16_audio.nbytes)
+    wav[:len(header)] = header
+    wav[len(header):] = memoryview(int16_audio).cast('B')
+    del int16_audio
+    b64 = base64.b64encode(wav).decode('ascii')
+    del wav
+    return b64
 
 
 @app.post("/tts/bark")
-async def tts_bark(req: Request) -> JSONResponse:
+async def tts_bark(req: Request) -> ORJSONResponse:
     """Synthesize speech using the Bark model."""
     validate_key(req, "API_KEY_BARK")
-    data = await req.json()
+    data = await read_json_body(req)
     text = data.get("text")
-    if not text:
+    if not text or not isinstance(text, str):
         raise HTTPException(status_code=400, detail="Missing 'text' in request body")
     voice_preset = data.get("voice_preset")
+    if voice_preset is not None and not isinstance(voice_preset, str):
+        raise HTTPException(status_code=400, detail="'voice_preset' must be a string")
     start = time.time()
     try:
-        provider = get_provider("bark")
-        audio, sample_rate = provider.synthesize(text, voice_preset=voice_preset)
+        provider = await resolve_provider("bark")
+        audio, sample_rate = await get_batcher("bark", provider).submit(text, voice_preset=voice_preset)
     except ValueError as exc:
         logger.warning("Bark provider unavailable: %s", exc)
         raise HTTPException(status_code=503, detail=f"Bark provider is not available: {exc}")
@@ -140,8 +374,10 @@ async def tts_bark(req: Request) -> JSONResponse:
         logger.exception("Bark synthesis failed: %s", exc)
         raise HTTPException(status_code=500, detail=f"Bark synthesis failed: {exc}")
     duration_ms = (time.time() - start) * 1000.0
-    b64_audio = audio_to_base64(audio, sample_rate)
-    return JSONResponse({
+    b64_audio = await run_blocking(audio_to_base64, audio, sample_rate)
+    # Release the samples before the response body is built
+    del audio
+    return ORJSONResponse({
         "provider": "bark",
         "sample_rate": sample_rate,
         "duration_ms": duration_ms,
@@ -150,17 +386,18 @@ async def tts_bark(req: Request) -> JSONResponse:
 
 
 @app.post("/tts/coqui")
-async def tts_coqui(req: Request) -> JSONResponse:
+async def tts_coqui(req: Request) -> ORJSONResponse:
     """Synthesize speech using the Coqui TTS model."""
     validate_key(req, "API_KEY_COQUI")
-    data = await req.json()
+    data = await read_json_body(req)
     text = data.get("text")
-    if not text:
+    if not text or not isinstance(text, str):
         raise HTTPException(status_code=400, detail="Missing 'text' in request body")
     start = time.time()
     try:
-        provider = get_provider("coqui")
-        audio, sample_rate = provider.synthesize(text)
+        provider = await resolve_provider("coqui")
+        # Tacotron2 keeps its decoder state on the module, so calls must not overlap
+        audio, sample_rate = await get_batcher("coqui", provider, max_batch_size=1).submit(text)
     except ValueError as exc:
         logger.warning("Coqui provider unavailable: %s", exc)
         raise HTTPException(status_code=503, detail=f"Coqui provider is not available: {exc}")
@@ -168,8 +405,10 @@ async def tts_coqui(req: Request) -> JSONResponse:
         logger.exception("Coqui synthesis failed: %s", exc)
         raise HTTPException(status_code=500, detail=f"Coqui synthesis failed: {exc}")
     duration_ms = (time.time() - start) * 1000.0
-    b64_audio = audio_to_base64(audio, sample_rate)
-    return JSONResponse({
+    b64_audio = await run_blocking(audio_to_base64, audio, sample_rate)
+    # Release the samples before the response body is built
+    del audio
+    return ORJSONResponse({
         "provider": "coqui",
         "sample_rate": sample_rate,
         "duration_ms": duration_ms,
@@ -178,19 +417,19 @@ async def tts_coqui(req: Request) -> JSONResponse:
 
 
 @app.post("/tts/elevenlabs")
-async def tts_elevenlabs(req: Request) -> JSONResponse:
+async def tts_elevenlabs(req: Request) -> ORJSONResponse:
     """Synthesize speech using the ElevenLabs hosted API."""
     validate_key(req, "API_KEY_ELEVENLABS")
-    data = await req.json()
+    data = await read_json_body(req)
     text = data.get("text")
-    if not text:
+    if not text or not isinstance(text, str):
         raise HTTPException(status_code=400, detail="Missing 'text' in request body")
     voice_id = data.get("voice_id")
     model_id = data.get("model_id")
     start = time.time()
     try:
-        provider = get_provider("elevenlabs")
-        audio_bytes, sample_rate = provider.synthesize(text, voice_id=voice_id, model_id=model_id)
+        provider = await resolve_provider("elevenlabs")
+        b64_audio, sample_rate = await run_blocking(provider.synthesize_b64, text, voice_id=voice_id, model_id=model_id)
     except ValueError as exc:
         logger.warning("ElevenLabs provider unavailable: %s", exc)
         raise HTTPException(status_code=503, detail=f"ElevenLabs provider is not available: {exc}")
@@ -198,8 +437,7 @@ async def tts_elevenlabs(req: Request) -> JSONResponse:
         logger.exception("ElevenLabs synthesis failed: %s", exc)
         raise HTTPException(status_code=500, detail=f"ElevenLabs synthesis failed: {exc}")
     duration_ms = (time.time() - start) * 1000.0
-    b64_audio = audio_to_base64(audio_bytes, sample_rate)
-    return JSONResponse({
+    return ORJSONResponse({
         "provider": "elevenlabs",
         "sample_rate": sample_rate,
         "duration_ms": duration_ms,
@@ -208,19 +446,23 @@ async def tts_elevenlabs(req: Request) -> JSONResponse:
 
 
 @app.post("/tts/kokoro")
-async def tts_kokoro(req: Request) -> JSONResponse:
+async def tts_kokoro(req: Request) -> ORJSONResponse:
     """Synthesize speech using the Kokoro model."""
     validate_key(req, "API_KEY_KOKORO")
-    data = await req.json()
+    data = await read_json_body(req)
     text = data.get("text")
-    if not text:
+    if not text or not isinstance(text, str):
         raise HTTPException(status_code=400, detail="Missing 'text' in request body")
     voice = data.get("voice")
     lang_code = data.get("lang_code")
     start = time.time()
     try:
-        provider = get_provider("kokoro")
-        audio, sample_rate = provider.synthesize(text, voice=voice, lang_code=lang_code)
+        provider = await resolve_provider("kokoro")
+        # The Kokoro pipeline is shared, so calls must not overlap.  Output is
+        # quantised to int16 by the provider, so audio_to_base64 skips that step
+        audio, sample_rate = await get_batcher("kokoro", provider, max_batch_size=1).submit(
+            text, voice=voice, lang_code=lang_code, return_int16=True
+        )
     except ValueError as exc:
         logger.warning("Kokoro provider unavailable: %s", exc)
         raise HTTPException(status_code=503, detail=f"Kokoro provider is not available: {exc}")
@@ -228,8 +470,10 @@ async def tts_kokoro(req: Request) -> JSONResponse:
         logger.exception("Kokoro synthesis failed: %s", exc)
         raise HTTPException(status_code=500, detail=f"Kokoro synthesis failed: {exc}")
     duration_ms = (time.time() - start) * 1000.0
-    b64_audio = audio_to_base64(audio, sample_rate)
-    return JSONResponse({
+    b64_audio = await run_blocking(audio_to_base64, audio, sample_rate)
+    # Release the samples before the response body is built
+    del audio
+    return ORJSONResponse({
         "provider": "kokoro",
         "sample_rate": sample_rate,
         "duration_ms": duration_ms,
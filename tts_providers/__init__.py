@@ -13,6 +13,7 @@ from __future__ import annotations
 from typing import Dict, Optional
 import os
 import logging
+import threading
 
 # Conditionally import provider classes based on available dependencies
 try:
@@ -42,48 +43,91 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 _providers: Dict[str, object] = {}
+# One lock per provider so concurrent first requests load each model once
+_locks: Dict[str, threading.Lock] = {n: threading.Lock() for n in ("bark", "coqui", "elevenlabs", "kokoro")}
 
-def get_provider(name: str):
-    """Return a cached provider instance by name.
-
-    Supported names are ``"bark"``, ``"coqui"``, ``"elevenlabs"`` and
-    ``"kokoro"``.  Instances are created lazily on first use and
-    cached for the lifetime of the process.
-
-    Raises:
-        ValueError: if the provider name is not recognised or not available.
-    """
-    lname = name.lower()
-    if lname in _providers:
-        return _providers[lname]
 
+def _create_provider(lname: str):
     if lname == "bark":
         if not BARK_AVAILABLE:
             raise ValueError("Bark provider is not available. Install transformers and torch packages to use it.")
-        logger.info("Initializing Bark provider … this may take a while …")
-        _providers[lname] = BarkProvider()
+        logger.debug("Initializing Bark provider … this may take a while …")
+        return BarkProvider()
     elif lname == "coqui":
         if not COQUI_AVAILABLE:
             raise ValueError("Coqui provider is not available. Install TTS package to use it.")
-        logger.info("Initializing Coqui provider … this may take a while …")
-        _providers[lname] = CoquiProvider()
+        logger.debug("Initializing Coqui provider … this may take a while …")
+        return CoquiProvider()
     elif lname == "elevenlabs":
         if not ELEVENLABS_AVAILABLE:
             raise ValueError("ElevenLabs provider is not available. Install elevenlabs package to use it.")
-        logger.info("Initializing ElevenLabs provider … this may take a while …")
+        logger.debug("Initializing ElevenLabs provider … this may take a while …")
         # Pull credentials from environment on first load
         api_key = os.getenv("ELEVENLABS_API_KEY")
         voice_id = os.getenv("ELEVENLABS_VOICE_ID")
         model_id = os.getenv("ELEVENLABS_MODEL_ID")
         sample_rate = int(os.getenv("ELEVENLABS_SAMPLE_RATE", "24000"))
-        _providers[lname] = ElevenLabsProvider(api_key=api_key, voice_id=voice_id, model_id=model_id, sample_rate=sample_rate)
+        return ElevenLabsProvider(api_key=api_key, voice_id=voice_id, model_id=model_id, sample_rate=sample_rate)
     elif lname == "kokoro":
         if not KOKORO_AVAILABLE:
             raise ValueError("Kokoro provider is not available. Install kokoro package to use it.")
-        logger.info("Initializing Kokoro provider … this may take a while …")
+        logger.debug("Initializing Kokoro provider … this may take a while …")
         lang_code = os.getenv("KOKORO_LANG_CODE", "a")
         voice = os.getenv("KOKORO_VOICE", "af_heart")
-        _providers[lname] = KokoroProvider(lang_code=lang_code, voice=voice)
+        return KokoroProvider(lang_code=lang_code, voice=voice)
     else:
+        raise ValueError(f"Unknown provider '{lname}'")
+
+
+def _lock_for(name: str) -> threading.Lock:
+    lock = _locks.get(name.lower())
+    if lock is None:
         raise ValueError(f"Unknown provider '{name}'")
-    return _providers[lname]
+    return lock
+
+
+def get_provider(name: str):
+    """Return a cached provider instance by name.
+
+    Supported names are ``"bark"``, ``"coqui"``, ``"elevenlabs"`` and
+    ``"kokoro"``.  Instances are created lazily on first use, together
+    with their model, and cached for the lifetime of the process.
+    Creation and model loading are serialised per provider and the
+    instance is only cached once loaded, so concurrent first calls wait
+    for a single load instead of loading the model again.  This call
+    blocks for as long as the model takes to load.
+
+    Raises:
+        ValueError: if the provider name is not recognised or not available.
+    """
+    lname = name.lower()
+    provider = _providers.get(lname)
+    if provider is not None:
+        return provider
+    with _lock_for(name):
+        provider = _providers.get(lname)
+        if provider is None:
+            provider = _create_provider(lname)
+            load = getattr(provider, "_load", None)
+            if load is not None:
+                load()
+            _providers[lname] = provider
+    return provider
+
+
+def get_cached_provider(name: str):
+    """Return the provider if it is already loaded, otherwise ``None``.
+
+    Unlike :func:`get_provider` this never blocks, so it is safe to call
+    from the event loop.
+    """
+    return _providers.get(name.lower())
+
+
+def warm_provider(name: str):
+    """Create the named provider and load its model ahead of the first request.
+
+    Raises:
+        ValueError: if the provider name is not recognised or not available.
+    """
+    return get_provider(name)
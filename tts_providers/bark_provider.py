@@ -15,17 +15,28 @@ Example:
 from __future__ import annotations
 
 import logging
-from typing import Tuple, Optional
+import os
+import re
+from typing import List, Tuple, Optional
 
 import numpy as np
 
 try:
+    import torch
     from transformers import BarkModel, BarkProcessor
+    from .precision import apply_precision
 except ImportError as exc:
     raise ImportError("BarkProvider requires the 'transformers' package. Please add it to requirements.") from exc
 
 logger = logging.getLogger(__name__)
 
+# Sentence boundaries used to split long prompts into a batch
+_SENT = re.compile(r'(?<=[.!?])\s+')
+# Upper bound on the number of sentences passed to a single generate call
+_MAX_SENTENCE_BATCH = 8
+# Set ZAPPER_TTS_COMPILE=1 to compile the Bark sub-models with TorchInductor
+_COMPILE = os.getenv("ZAPPER_TTS_COMPILE", "0").strip().lower() in ("1", "true", "yes")
+
 
 class BarkProvider:
     """Wrapper around the Bark small model.
@@ -44,12 +55,29 @@ class BarkProvider:
         """Load the Bark model and processor if not already loaded."""
         if self.model is None or self.processor is None:
             logger.info("Loading Bark model '%s' …", self.model_name)
-            self.model = BarkModel.from_pretrained(self.model_name)
+            self.model = apply_precision(BarkModel.from_pretrained(self.model_name), "Bark")
+            self.model.eval()
+            if _COMPILE:
+                self._compile()
             self.processor = BarkProcessor.from_pretrained(self.model_name)
             # Determine the sampling rate from the generation config
             self.sample_rate = self.model.generation_config.sample_rate
             logger.info("Bark model loaded (sample_rate=%s)", self.sample_rate)
 
+    def _compile(self) -> None:
+        """Compile the forward pass of each Bark sub-model.
+
+        ``generate`` is plain Python driving the semantic, coarse and fine
+        sub-models, so their ``forward`` methods are compiled rather than
+        the wrapping ``BarkModel``.  Sequence lengths change on every
+        decoding step, hence ``dynamic=True``.
+        """
+        for name in ("semantic", "coarse_acoustics", "fine_acoustics"):
+            submodel = getattr(self.model, name, None)
+            if submodel is not None:
+                submodel.forward = torch.compile(submodel.forward, dynamic=True, fullgraph=False)
+        logger.info("Compiled Bark sub-models with torch.compile")
+
     def synthesize(self, text: str, voice_preset: Optional[str] = None) -> Tuple[np.ndarray, int]:
         """Synthesize text into speech.
 
@@ -64,12 +92,62 @@ class BarkProvider:
         """
         if not text:
             raise ValueError("Text must not be empty for Bark synthesis")
+        return self.synthesize_batch([text], voice_preset=voice_preset)[0]
+
+    def synthesize_batch(self, texts: List[str], voice_preset: Optional[str] = None) -> List[Tuple[np.ndarray, int]]:
+        """Synthesize several texts with batched ``generate`` calls.
+
+        Each text is split into sentences and the sentences of all texts
+        are generated together, up to ``_MAX_SENTENCE_BATCH`` per call.
+        The audio of each text's sentences is then joined back together.
+        All texts share the same voice preset.
+
+        Args:
+            texts: The input texts to synthesize.
+            voice_preset: Optional voice preset supported by Bark.
+
+        Returns:
+            A list of ``(audio, sample_rate)`` tuples in the same order as
+            ``texts``.
+        """
+        if not texts or not all(texts):
+            raise ValueError("Text must not be empty for Bark synthesis")
         self._load()
         preset = voice_preset or "v2/en_speaker_2"
-        logger.info("Generating Bark audio with preset '%s'", preset)
-        inputs = self.processor(text, voice_preset=preset)
-        # Generate returns a list with one element per input
-        speech_output = self.model.generate(**inputs)
-        # Convert to numpy on CPU
-        audio = speech_output.cpu().numpy()[0]
-        return audio.astype(np.float32), self.sample_rate
+        sentences: List[str] = []
+        counts: List[int] = []
+        for text in texts:
+            parts = [part for part in _SENT.split(text.strip()) if part] or [text]
+            sentences.extend(parts)
+            counts.append(len(parts))
+        logger.info(
+            "Generating Bark audio for %d text(s) (%d sentence(s)) with preset '%s'",
+            len(texts), len(sentences), preset,
+        )
+        clips: List[np.ndarray] = []
+        for i in range(0, len(sentences), _MAX_SENTENCE_BATCH):
+            clips.extend(self._generate(sentences[i:i + _MAX_SENTENCE_BATCH], preset))
+        results = []
+        offset = 0
+        for count in counts:
+            parts = clips[offset:offset + count]
+            offset += count
+            audio = parts[0] if count == 1 else np.concatenate(parts)
+            results.append((audio, self.sample_rate))
+        return results
+
+    def _generate(self, sentences: List[str], preset: str) -> List[np.ndarray]:
+        """Run one batched ``generate`` call and return the audio per input."""
+        # The processor pads the inputs to a common length and the attention
+        # mask keeps padding from affecting the output
+        inputs = self.processor(sentences, voice_preset=preset)
+        # Batched outputs are padded, so ask for the true length of each item
+        with torch.inference_mode():
+            speech_output, output_lengths = self.model.generate(**inputs, return_output_lengths=True)
+        # Convert to float32 numpy on CPU (a no-op cast unless the model runs
+        # in reduced precision)
+        audio = speech_output.float().cpu().numpy()
+        return [
+            np.ascontiguousarray(audio[i, :length], dtype=np.float32)
+            for i, length in enumerate(output_lengths)
+        ]
@@ -14,7 +14,9 @@ from typing import Tuple
 import numpy as np
 
 try:
+    import torch
     from TTS.api import TTS as CoquiTTS
+    from .precision import apply_precision
 except ImportError as exc:
     raise ImportError("CoquiProvider requires the 'TTS' package. Please add it to requirements.") from exc
 
@@ -34,6 +36,13 @@ class CoquiProvider:
             logger.info("Loading Coqui TTS model '%s' …", self.model_name)
             # progress_bar=False avoids printing progress to stderr
             self.tts = CoquiTTS(model_name=self.model_name, progress_bar=False)
+            # The synthesizer feeds float32 tensors to its models, so only
+            # int8 dynamic quantization is applicable
+            synthesizer = self.tts.synthesizer
+            for attr in ("tts_model", "vocoder_model"):
+                module = getattr(synthesizer, attr, None)
+                if module is not None:
+                    setattr(synthesizer, attr, apply_precision(module, f"Coqui {attr}", supported=("int8",)))
             # Some models expose synthesizer.sample_rate, others output_sample_rate
             try:
                 self.sample_rate = int(getattr(self.tts.synthesizer, "output_sample_rate", getattr(self.tts.synthesizer, "sample_rate", 22050)))
@@ -56,5 +65,7 @@ class CoquiProvider:
         self._load()
         logger.info("Generating Coqui audio …")
         # The tts() method returns a numpy array of float32 samples in [-1, 1]
-        audio = self.tts.tts(text)
-        return audio.astype(np.float32), self.sample_rate
+        with torch.inference_mode():
+            audio = self.tts.tts(text)
+        # Only copies if the model returned another dtype (or a plain list)
+        return np.ascontiguousarray(audio, dtype=np.float32), self.sample_rate
@@ -9,19 +9,25 @@ configured via environment variables or constructor arguments.
 
 The `synthesize` method returns raw audio bytes (already encoded as
 PCM).  If a sample rate is provided, the caller can package it into a
-WAV.
+WAV.  `synthesize_b64` returns the same stream base64 encoded, encoding
+each chunk as it arrives instead of joining the whole stream first.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Optional, Tuple
+from typing import Iterator, Optional, Tuple
 
 try:
     from elevenlabs.client import ElevenLabs
 except ImportError as exc:
     raise ImportError("ElevenLabsProvider requires the 'elevenlabs' package. Please add it to requirements.") from exc
 
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
 logger = logging.getLogger(__name__)
 
 
@@ -49,19 +55,7 @@ class ElevenLabsProvider:
             # When no API key is provided, the client will throw on first call
             self.client = ElevenLabs(api_key=self.api_key)
 
-    def synthesize(self, text: str, voice_id: Optional[str] = None, model_id: Optional[str] = None) -> Tuple[bytes, int]:
-        """Generate speech using ElevenLabs.
-
-        Args:
-            text: Text to be synthesized.
-            voice_id: Optional voice ID overriding the default.
-            model_id: Optional model ID overriding the default.
-
-        Returns:
-            A tuple ``(audio_bytes, sample_rate)``.  ``audio_bytes``
-            contains the raw PCM stream returned by ElevenLabs and
-            ``sample_rate`` is the configured sampling rate.
-        """
+    def _stream(self, text: str, voice_id: Optional[str], model_id: Optional[str]) -> Iterator[bytes]:
         if not text:
             raise ValueError("Text must not be empty for ElevenLabs synthesis")
         self._load()
@@ -71,11 +65,68 @@ class ElevenLabsProvider:
             logger.warning("Voice ID or model ID is missing; using ElevenLabs defaults")
         logger.info("Requesting ElevenLabs synthesis (voice_id=%s, model_id=%s)", use_voice_id, use_model_id)
         # The SDK returns a generator yielding chunks of audio bytes
-        audio_stream = self.client.text_to_speech.stream(
+        return self.client.text_to_speech.stream(
             text=text,
             voice_id=use_voice_id,
             model_id=use_model_id,
         )
+
+    def synthesize(self, text: str, voice_id: Optional[str] = None, model_id: Optional[str] = None) -> Tuple[bytes, int]:
+        """Generate speech using ElevenLabs.
+
+        Args:
+            text: Text to be synthesized.
+            voice_id: Optional voice ID overriding the default.
+            model_id: Optional model ID overriding the default.
+
+        Returns:
+            A tuple ``(audio_bytes, sample_rate)``.  ``audio_bytes``
+            contains the raw PCM stream returned by ElevenLabs and
+            ``sample_rate`` is the configured sampling rate.
+        """
+        audio_stream = self._stream(text, voice_id, model_id)
         # Concatenate all bytes into one blob
         audio_bytes = b"".join(audio_stream)
         return audio_bytes, self.sample_rate
+
+    def synthesize_b64(self, text: str, voice_id: Optional[str] = None, model_id: Optional[str] = None) -> Tuple[str, int]:
+        """Generate speech using ElevenLabs and return it base64 encoded.
+
+        Chunks are encoded as they are streamed.  Base64 maps every 3
+        input bytes to 4 output characters, so the 0–2 bytes left over
+        from the previous chunk are completed with the first bytes of the
+        next one and encoded on their own.  The rest of the chunk is then
+        encoded in place, up to its last multiple of 3 bytes.  The output
+        is collected in a single buffer and is identical to encoding the
+        joined stream.
+
+        Args:
+            text: Text to be synthesized.
+            voice_id: Optional voice ID overriding the default.
+            model_id: Optional model ID overriding the default.
+
+        Returns:
+            A tuple ``(audio_base64, sample_rate)``.
+        """
+        encoded = bytearray()
+        leftover = b""
+        for chunk in self._stream(text, voice_id, model_id):
+            if not chunk:
+                continue
+            start = 0
+            if leftover:
+                # At most 3 bytes are copied to complete the leftover group
+                start = 3 - len(leftover)
+                head = leftover + chunk[:start]
+                if len(head) < 3:
+                    leftover = head
+                    continue
+                encoded += base64.b64encode(head)
+            view = memoryview(chunk)
+            take = start + (len(chunk) - start) // 3 * 3
+            if take > start:
+                encoded += base64.b64encode(view[start:take])
+            leftover = bytes(view[take:])
+        if leftover:
+            encoded += base64.b64encode(leftover)
+        return encoded.decode('ascii'), self.sample_rate
@@ -9,12 +9,16 @@ array and returns the audio along with the sample rate (24 kHz).
 from __future__ import annotations
 
 import logging
+import threading
 from typing import Tuple, Optional
 
 import numpy as np
 
 try:
+    import torch
     from kokoro import KPipeline
+    from .pcm import tensor_to_pcm16
+    from .precision import apply_precision
 except ImportError as exc:
     raise ImportError("KokoroProvider requires the 'kokoro' package. Please add it to requirements.") from exc
 
@@ -30,45 +34,72 @@ class KokoroProvider:
         self.pipeline: Optional[KPipeline] = None
         # Kokoro outputs 24 kHz audio by default
         self.sample_rate: int = 24000
+        # Guards switching the pipeline language when called from several threads
+        self._lock = threading.Lock()
 
     def _load(self) -> None:
         if self.pipeline is None:
             logger.info("Initializing Kokoro pipeline (lang_code=%s) …", self.lang_code)
             self.pipeline = KPipeline(lang_code=self.lang_code)
+            # Voice embeddings are float32, so only int8 dynamic
+            # quantization is applicable
+            if getattr(self.pipeline, "model", None) is not None:
+                self.pipeline.model = apply_precision(self.pipeline.model, "Kokoro", supported=("int8",))
             logger.info("Kokoro pipeline loaded")
 
-    def synthesize(self, text: str, voice: Optional[str] = None, lang_code: Optional[str] = None) -> Tuple[np.ndarray, int]:
+    def synthesize(
+        self,
+        text: str,
+        voice: Optional[str] = None,
+        lang_code: Optional[str] = None,
+        return_int16: bool = False,
+    ) -> Tuple[np.ndarray, int]:
         """Generate speech using Kokoro.
 
         Args:
             text: Text to synthesize.
             voice: Optional voice name overriding the default.
             lang_code: Optional language code overriding the default.
+            return_int16: Quantise tensor output to 16-bit PCM on the torch
+                side instead of returning float32.
 
         Returns:
             A tuple ``(audio, sample_rate)`` where ``audio`` is a 1‑D
-            numpy array of float32 samples.
+            numpy array of float32 samples, or int16 samples if
+            ``return_int16`` is set and the pipeline produced tensors.
         """
         if not text:
             raise ValueError("Text must not be empty for Kokoro synthesis")
-        # If lang_code overrides, reload the pipeline for new language
-        if lang_code and lang_code != self.lang_code:
-            self.lang_code = lang_code
-            self.pipeline = None
-        self._load()
+        with self._lock:
+            # If lang_code overrides, reload the pipeline for new language
+            if lang_code and lang_code != self.lang_code:
+                self.lang_code = lang_code
+                self.pipeline = None
+            self._load()
+            pipeline = self.pipeline
+            use_lang_code = self.lang_code
         use_voice = voice or self.voice
-        logger.info("Generating Kokoro audio (lang_code=%s, voice=%s) …", self.lang_code, use_voice)
+        logger.info("Generating Kokoro audio (lang_code=%s, voice=%s) …", use_lang_code, use_voice)
         # Kokoro returns a generator yielding (generation_status, phoneme_status, audio_chunk)
-        audio_chunks = []
-        for _, _, audio in self.pipeline(text, voice=use_voice):
-            # Each audio chunk is a torch.Tensor; convert to numpy
-            try:
-                audio_chunks.append(audio.numpy())
-            except Exception:
-                # If already numpy
-                audio_chunks.append(np.asarray(audio))
-        if audio_chunks:
-            audio_out = np.concatenate(audio_chunks).astype(np.float32)
-        else:
-            audio_out = np.array([], dtype=np.float32)
+        with torch.inference_mode():
+            audio_chunks = [
+                audio for _, _, audio in pipeline(text, voice=use_voice)
+                if audio is not None and audio.shape[0]
+            ]
+        if audio_chunks and all(isinstance(chunk, torch.Tensor) for chunk in audio_chunks):
+            # Join on the torch side and convert to numpy once
+            joined = torch.cat(audio_chunks)
+            if return_int16:
+                return tensor_to_pcm16(joined), self.sample_rate
+            audio_out = joined.contiguous().cpu().numpy()
+            return np.ascontiguousarray(audio_out, dtype=np.float32), self.sample_rate
+        # Otherwise copy each chunk straight into a preallocated float32
+        # buffer rather than concatenating and then converting
+        audio_chunks = [np.asarray(chunk) for chunk in audio_chunks]
+        total = sum(chunk.shape[0] for chunk in audio_chunks)
+        audio_out = np.empty(total, dtype=np.float32)
+        offset = 0
+        for chunk in audio_chunks:
+            audio_out[offset:offset + chunk.shape[0]] = chunk
+            offset += chunk.shape[0]
         return audio_out, self.sample_rate
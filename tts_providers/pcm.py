@@ -0,0 +1,32 @@
+"""Conversion of torch model output to 16-bit PCM samples.
+
+Providers whose models produce torch tensors use this when asked for
+int16 audio, so the samples are normalised and quantised on the torch
+side before conversion to numpy.  NumPy output is left to
+``audio_to_base64`` in ``tts_main``, whose scaling this matches: audio
+whose peak exceeds 1.0 is normalised to that peak and samples are
+truncated towards zero.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import torch
+
+
+def tensor_to_pcm16(audio: torch.Tensor) -> np.ndarray:
+    """Quantise a float tensor to an int16 numpy array.
+
+    The tensor is scaled in place, so callers must pass a tensor they own
+    (e.g. the result of ``torch.cat``).
+    """
+    if audio.numel() == 0:
+        return np.empty(0, dtype=np.int16)
+    with torch.inference_mode():
+        audio = audio.reshape(-1).float()
+        low, high = torch.aminmax(audio)
+        peak = max(float(high), -float(low), 1.0)
+        # Scale computed in float32, as in audio_to_base64
+        scale = float(np.float32(32767.0) / np.float32(peak))
+        return audio.mul_(scale).to(torch.int16).cpu().numpy()
+
@@ -0,0 +1,64 @@
+"""Reduced precision inference for the local TTS models.
+
+The precision is selected with the ``ZAPPER_TTS_DTYPE`` environment
+variable:
+
+* ``fp32`` (default) — leave the model untouched.
+* ``bf16`` — cast the model weights to ``torch.bfloat16``.  Only
+  providers whose inputs are token ids (Bark) support this, because
+  float inputs would no longer match the weight dtype.
+* ``int8`` — apply dynamic int8 quantization to every ``nn.Linear``
+  layer.  Activations stay float32, so this works for every torch
+  model running on the CPU; models on a GPU are left in fp32.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from typing import Sequence
+
+import torch
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_DTYPES = ("fp32", "bf16", "int8")
+
+
+def requested_dtype() -> str:
+    """Return the precision configured via ``ZAPPER_TTS_DTYPE``."""
+    dtype = os.getenv("ZAPPER_TTS_DTYPE", "fp32").strip().lower() or "fp32"
+    if dtype not in SUPPORTED_DTYPES:
+        logger.warning("Unknown ZAPPER_TTS_DTYPE '%s'; using fp32", dtype)
+        return "fp32"
+    return dtype
+
+
+def apply_precision(model: torch.nn.Module, name: str, supported: Sequence[str] = ("bf16", "int8")) -> torch.nn.Module:
+    """Convert ``model`` to the configured precision and return it.
+
+    Args:
+        model: The torch module to convert.
+        name: Human readable model name used in log messages.
+        supported: The reduced precisions this model can run with.
+
+    Returns:
+        The converted module, or ``model`` unchanged for fp32 or an
+        unsupported precision.
+    """
+    dtype = requested_dtype()
+    if dtype == "fp32":
+        return model
+    if dtype not in supported:
+        logger.warning("%s does not support %s inference; keeping fp32", name, dtype)
+        return model
+    if dtype == "int8":
+        # Dynamic quantization kernels only exist for the CPU
+        devices = {param.device.type for param in model.parameters()}
+        if devices - {"cpu"}:
+            logger.warning("%s runs on %s; int8 quantization needs the CPU, keeping fp32", name, ", ".join(sorted(devices)))
+            return model
+    logger.info("Converting %s to %s", name, dtype)
+    if dtype == "bf16":
+        return model.to(torch.bfloat16)
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)